@@ -12,8 +12,8 @@ from .timeprogram import TimeProgram, TimeProgramDay, TimePeriodSetting  # noqa:
 from .common import Component, Function  # noqa: F401
 from .zone import ZoneCooling, ZoneHeating, Zone, ActiveFunction  # noqa: F401
 from .room import Device, Room  # noqa: F401
-from .status import HvacStatus, BoilerStatus, Error  # noqa: F401
-from .syncstate import SyncState  # noqa: F401
+from .status import HvacStatus, BoilerStatus, Error, OnlineStatus, UpdateStatus  # noqa: F401
+from .syncstate import SyncState, SyncStates  # noqa: F401
 from .dhw import Dhw, HotWater, Circulation  # noqa: F401
 from .report import Report, EmfReport  # noqa: F401
 from .ventilation import Ventilation  # noqa: F401
@@ -45,16 +45,28 @@ class Function:
         may not receive the active mode that is really applied. You should use
         :class:`~pymultimatic.model.system.System` for that.
         """
+        return self.active_mode_at(datetime.now())
+
+    def active_mode_at(self, now: datetime) -> ActiveMode:
+        """Same as :attr:`active_mode`, but using the given time to look up
+        the time program.
+
+        Args:
+            now (datetime): The time to get the active mode for.
+
+        Returns:
+            ActiveMode: The active mode.
+        """
         mode = None
         if (
-            self.operating_mode == OperatingModes.AUTO
-            or self.operating_mode == OperatingModes.TIME_CONTROLLED
+            self.operating_mode is OperatingModes.AUTO
+            or self.operating_mode is OperatingModes.TIME_CONTROLLED
         ):
             if self.time_program:
-                setting = self.time_program.get_for(datetime.now())
+                setting = self.time_program.get_for(now)
                 if setting:
-                    if setting.setting in [SettingModes.DAY, SettingModes.ON]:
-                        if self.operating_mode == OperatingModes.AUTO:
+                    if setting.setting in (SettingModes.DAY, SettingModes.ON):
+                        if self.operating_mode is OperatingModes.AUTO:
                             target = self.target_high
                         else:
                             target = setting.target_temperature
@@ -25,16 +25,18 @@ class HotWater(Function, Component):
     quick_veto = attr.ib(default=None, init=False)
     target_low = attr.ib(default=MIN_TARGET_TEMP, init=False)
 
+    _TARGET_HIGH_MODES = frozenset((OperatingModes.ON, OperatingModes.MANUAL))
+    """Modes running at :attr:`target_high`."""
+
     def _active_mode(self) -> ActiveMode:
         mode: ActiveMode
-        if (
-            self.operating_mode == OperatingModes.AUTO
+        operating_mode = self.operating_mode
+        if operating_mode in self._TARGET_HIGH_MODES:
+            mode = ActiveMode(self.target_high, operating_mode)
+        elif (
+            operating_mode is OperatingModes.AUTO
         ):  # auto at this point mean we have a "direct heater"
             mode = ActiveMode(self.target_high, OperatingModes.AUTO, SettingModes.ON)
-        elif (
-            self.operating_mode == OperatingModes.ON or self.operating_mode == OperatingModes.MANUAL
-        ):
-            mode = ActiveMode(self.target_high, self.operating_mode)
         else:  # MODE_OFF
             mode = ActiveMode(constants.FROST_PROTECTION_TEMP, OperatingModes.OFF)
         return mode
@@ -58,17 +60,17 @@ class Circulation(Function, Component):
     def _active_mode(self) -> ActiveMode:
         mode: ActiveMode
         if (
-            self.operating_mode == OperatingModes.AUTO
+            self.operating_mode is OperatingModes.AUTO
         ):  # auto at this point mean we have a "direct heater"
             mode = ActiveMode(self.target_low, OperatingModes.AUTO, SettingModes.OFF)
-        elif self.operating_mode == OperatingModes.ON:
+        elif self.operating_mode is OperatingModes.ON:
             mode = ActiveMode(self.target_high, OperatingModes.ON)
         else:  # MODE_OFF
             mode = ActiveMode(self.target_low, OperatingModes.OFF)
         return mode
 
 
-@attr.s
+@attr.s(slots=True)
 class Dhw:
     """This is representing the DHW (Domestic Hot Water) from the system."""
 
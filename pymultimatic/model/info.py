@@ -2,7 +2,7 @@
 import attr
 
 
-@attr.s
+@attr.s(slots=True)
 class FacilityDetail:
     """Facility information.
 
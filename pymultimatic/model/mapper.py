@@ -34,6 +34,8 @@ from . import (
 
 _DATE_FORMAT = "%Y-%m-%d"
 _DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_OPERATING_MODES = OperatingModes.BY_NAME
+_SETTING_MODES = SettingModes.BY_NAME
 _DAYS_OF_WEEK = [
     "monday",
     "tuesday",
@@ -233,7 +235,7 @@ def map_time_program_day(raw_time_program_day, key: Optional[str] = None) -> Tim
                 start_time = time_setting.get("startTime")
                 target_temp = time_setting.get("temperatureSetpoint")
                 if key:
-                    mode = SettingModes.get(time_setting.get(key))
+                    mode = _SETTING_MODES[time_setting.get(key)]
             else:
                 start_time = time_setting.get("start_time")
                 end_time = time_setting.get("end_time")
@@ -397,11 +399,11 @@ def _map_function(
 
     operating_mode: OperatingMode
     if rbr:
-        operating_mode = OperatingModes.get(mode) if mode else None
+        operating_mode = _OPERATING_MODES[mode] if mode else None
     elif quick_veto:
         operating_mode = OperatingModes.QUICK_VETO
     else:
-        operating_mode = OperatingModes.get(mode)
+        operating_mode = _OPERATING_MODES[mode]
 
     target_high = conf.get("setpoint_temperature", None)
     if not target_high:
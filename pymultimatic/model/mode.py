@@ -1,10 +1,15 @@
 """Vaillant operation modes."""
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import attr
 
+_MAX_QUICK_VETO_DURATION = 1440
+_MIN_QUICK_VETO_TARGET = 5
+_MAX_QUICK_VETO_TARGET = 30
 
-@attr.s
+
+@attr.s(slots=True)
 class Mode:
     """This is the base class for modes, it groups :class:`QuickVeto`,
     :class:`OperatingMode`, :class:`QuickMode` and :class:`SettingMode`.
@@ -16,10 +21,28 @@ class Mode:
     name = attr.ib(type=str, default=None)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, eq=False)
 class OperatingMode(Mode):
     """Represents the operating mode of a
-    :class:`~pymultimatic.model.component.Component`"""
+    :class:`~pymultimatic.model.component.Component`
+
+    Note:
+        Instances are singletons owned by :class:`OperatingModes`, equality
+        and hash are identity based. Do not instantiate outside of it.
+    """
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __copy__(self) -> "OperatingMode":
+        return self
+
+    def __deepcopy__(self, memodict: Any = None) -> "OperatingMode":
+        return self
+
+    def __reduce__(self) -> Any:
+        # Unpickle to the singleton, a new instance wouldn't compare equal
+        return getattr, (OperatingModes, self.name)
 
 
 class OperatingModes:
@@ -82,21 +105,23 @@ class OperatingModes:
     Frost protection is activated.
     """
 
-    _VALUES = {
-        opm.name: opm
-        for opm in [
-            AUTO,
-            DAY,
-            NIGHT,
-            ON,
-            OFF,
-            MANUAL,
-            QUICK_VETO,
-            TIME_CONTROLLED,
-            NORMAL,
-            REDUCED,
-        ]
-    }
+    _VALUES = MappingProxyType(
+        {
+            "AUTO": AUTO,
+            "DAY": DAY,
+            "NIGHT": NIGHT,
+            "ON": ON,
+            "OFF": OFF,
+            "MANUAL": MANUAL,
+            "QUICK_VETO": QUICK_VETO,
+            "TIME_CONTROLLED": TIME_CONTROLLED,
+            "NORMAL": NORMAL,
+            "REDUCED": REDUCED,
+        }
+    )
+
+    BY_NAME: Mapping[str, OperatingMode] = _VALUES
+    """Read-only mapping of all :class:`OperatingMode` by name."""
 
     @classmethod
     def get(cls, name: str) -> OperatingMode:
@@ -111,7 +136,7 @@ class OperatingModes:
         return cls._VALUES[name]
 
 
-@attr.s
+@attr.s(slots=True)
 class QuickVeto(Mode):
     """Represents a quick veto which can be applied to a
     :class:`~pymultimatic.model.component.Zone` or a
@@ -138,21 +163,58 @@ class QuickVeto(Mode):
     duration = attr.ib(type=Optional[int], default=None)
     target = attr.ib(type=float, default=None)
 
-    @duration.validator
-    def _duration_validator(self, attribute: str, value: Optional[int]) -> None:
-        if value is not None and value > 1440:
-            raise ValueError("{} with value {} is not valid".format(attribute, value))
+    @property
+    def remaining_duration(self) -> Optional[int]:
+        """Optional[int]: Former name of :attr:`duration`."""
+        return self.duration
 
-    @target.validator
-    def _target_validator(self, attribute: str, value: Optional[float]) -> None:
-        if value is None or not 5 <= value <= 30:
-            raise ValueError("{} with value {} is not valid".format(attribute, value))
+    @property
+    def target_temperature(self) -> float:
+        """float: Former name of :attr:`target`."""
+        return self.target
 
+    @duration.validator
+    def _duration_validator(
+        self, attribute: str, value: Optional[int], _max: int = _MAX_QUICK_VETO_DURATION
+    ) -> None:
+        if value is not None and value > _max:
+            raise ValueError(f"{attribute} with value {value} is not valid")
 
-@attr.s(frozen=True)
+    @target.validator
+    def _target_validator(
+        self,
+        attribute: str,
+        value: Optional[float],
+        _min: float = _MIN_QUICK_VETO_TARGET,
+        _max: float = _MAX_QUICK_VETO_TARGET,
+    ) -> None:
+        if value is not None and _min <= value <= _max:
+            return
+        raise ValueError(f"{attribute} with value {value} is not valid")
+
+
+@attr.s(frozen=True, slots=True, eq=False)
 class SettingMode(Mode):
     """This is the setting which is configured in
-    :class:`~pymultimatic.model.timeprogram.TimePeriodSetting`."""
+    :class:`~pymultimatic.model.timeprogram.TimePeriodSetting`.
+
+    Note:
+        Instances are singletons owned by :class:`SettingModes`, equality
+        and hash are identity based. Do not instantiate outside of it.
+    """
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __copy__(self) -> "SettingMode":
+        return self
+
+    def __deepcopy__(self, memodict: Any = None) -> "SettingMode":
+        return self
+
+    def __reduce__(self) -> Any:
+        # Unpickle to the singleton, a new instance wouldn't compare equal
+        return getattr, (SettingModes, self.name)
 
 
 class SettingModes:
@@ -187,7 +249,10 @@ class SettingModes:
     MANUAL = SettingMode("MANUAL")
     """Maintains temperature without interruption"""
 
-    _VALUES = {sm.name: sm for sm in [ON, OFF, DAY, NIGHT]}
+    _VALUES = MappingProxyType({"ON": ON, "OFF": OFF, "DAY": DAY, "NIGHT": NIGHT})
+
+    BY_NAME: Mapping[str, SettingMode] = _VALUES
+    """Read-only mapping of all :class:`SettingMode` by name."""
 
     @classmethod
     def get(cls, name: str) -> SettingMode:
@@ -202,7 +267,6 @@ class SettingModes:
         return cls._VALUES[name]
 
 
-@attr.s
 class ActiveMode:
     """Active mode will let you know the real target temperature and the real
     :class:`Mode` applied to a
@@ -233,17 +297,47 @@ class ActiveMode:
     Args:
         target (Optional[float]): Target temperature the
             :class:`~pymultimatic.model.component.Component` tries to reach.
-            Please note, there will be no `target_temperature` for
+            Please note, there will be no `target` for
             :class:`~pymultimatic.model.component.Circulation`.
         current (Mode): This is the mode that will be applied by your
             installation.
-        sub: (Mode): If `mode` is :class:`OperatingModes.AUTO`,
-            then `sub_mode` will be populated with the actual configured mode,
+        sub: (Mode): If `current` is :class:`OperatingModes.AUTO`,
+            then `sub` will be populated with the actual configured mode,
             coming from
             :class:`~pymultimatic.model.timeprogram.TimeProgramDaySetting.mode`
             , otherwise it will be `None`
     """
 
-    target = attr.ib(type=Optional[float])
-    current = attr.ib(type=Mode)
-    sub = attr.ib(type=Optional[Mode], default=None)
+    # Built for every component on each active mode evaluation, so it is
+    # kept as a plain slotted class instead of going through attrs.
+    __slots__ = ("target", "current", "sub")
+
+    def __init__(self, target: Optional[float], current: Mode, sub: Optional[Mode] = None):
+        self.target = target
+        self.current = current
+        self.sub = sub
+
+    def __repr__(self) -> str:
+        return f"ActiveMode(target={self.target!r}, current={self.current!r}, sub={self.sub!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ActiveMode):
+            return NotImplemented
+        return (self.target, self.current, self.sub) == (other.target, other.current, other.sub)
+
+    __hash__ = None
+
+    @property
+    def target_temperature(self) -> Optional[float]:
+        """Optional[float]: Former name of :attr:`target`."""
+        return self.target
+
+    @property
+    def current_mode(self) -> Mode:
+        """Mode: Former name of :attr:`current`."""
+        return self.current
+
+    @property
+    def sub_mode(self) -> Optional[Mode]:
+        """Optional[Mode]: Former name of :attr:`sub`."""
+        return self.sub
@@ -1,13 +1,44 @@
 """Vaillant operation modes."""
 from datetime import date
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 
 import attr
 
 from . import ActiveMode, Circulation, Component, HotWater, Mode, Room, Ventilation, Zone
 
+ZONE = 1
+"""Bit of :attr:`QuickMode.applies_to` set when applicable to a zone."""
 
-@attr.s(frozen=True)
+ROOM = 2
+"""Bit of :attr:`QuickMode.applies_to` set when applicable to a room."""
+
+DHW = 4
+"""Bit of :attr:`QuickMode.applies_to` set when applicable to hot water and
+circulation."""
+
+VENTILATION = 8
+"""Bit of :attr:`QuickMode.applies_to` set when applicable to ventilation."""
+
+_FLAG_BY_TYPE: Mapping[type, int] = MappingProxyType(
+    {
+        HotWater: DHW,
+        Circulation: DHW,
+        Room: ROOM,
+        Zone: ZONE,
+        Ventilation: VENTILATION,
+    }
+)
+
+
+def _flag_for_subclass(comp_type: type) -> int:
+    """Find the flag of a component type which is not directly registered
+    (subclass) through its MRO. The result isn't stored, so the table never
+    keeps a reference to the classes it is given."""
+    return next((_FLAG_BY_TYPE[t] for t in comp_type.__mro__ if t in _FLAG_BY_TYPE), 0)
+
+
+@attr.s(frozen=True, slots=True, eq=False)
 class QuickMode(Mode):
     """This class is a helper to check what is impacted by a quick mode.
 
@@ -43,6 +74,31 @@ class QuickMode(Mode):
     for_dhw = attr.ib(type=bool, default=None, eq=False)
     for_ventilation = attr.ib(type=bool, default=None, eq=False)
     duration = attr.ib(type=Optional[int], default=None, eq=False)
+    applies_to = attr.ib(type=int, init=False, eq=False, repr=False)
+    """Bitmask of :data:`ZONE`, :data:`ROOM`, :data:`DHW` and
+    :data:`VENTILATION` the quick mode is applicable to."""
+
+    @applies_to.default
+    def _applies_to(self) -> int:
+        return (
+            ZONE * bool(self.for_zone)
+            | ROOM * bool(self.for_room)
+            | DHW * bool(self.for_dhw)
+            | VENTILATION * bool(self.for_ventilation)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Quick modes are equal when they have the same name, whatever their
+        # duration. Copies made by QuickModes.get share the name object of
+        # the original, so the string compare stops at the identity check.
+        if self is other:
+            return True
+        if not isinstance(other, QuickMode):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
     def is_for(self, comp: Component) -> bool:
         """Check if the quick mode has impact on the given component.
@@ -54,15 +110,11 @@ class QuickMode(Mode):
             bool: Whether the component is affected by the quick mode or not.
         """
 
-        if isinstance(comp, (HotWater, Circulation)) and self.for_dhw:
-            return True
-        if isinstance(comp, Room) and self.for_room:
-            return True
-        if isinstance(comp, Zone) and self.for_zone:
-            return True
-        if isinstance(comp, Ventilation) and self.for_ventilation:
-            return True
-        return False
+        comp_type = type(comp)
+        flag = _FLAG_BY_TYPE.get(comp_type)
+        if flag is None:
+            flag = _flag_for_subclass(comp_type)
+        return bool(self.applies_to & flag)
 
 
 class QuickModes:
@@ -130,20 +182,28 @@ class QuickModes:
 
     COOLING_FOR_X_DAYS = QuickMode("QM_COOLING_FOR_X_DAYS", True, False, False, False)
 
-    _VALUES = {
-        qm.name: qm
-        for qm in [
-            HOTWATER_BOOST,
-            VENTILATION_BOOST,
-            ONE_DAY_AWAY,
-            SYSTEM_OFF,
-            ONE_DAY_AT_HOME,
-            PARTY,
-            HOLIDAY,
-            QUICK_VETO,
-            COOLING_FOR_X_DAYS,
-        ]
-    }
+    _VALUES = MappingProxyType(
+        {
+            "QM_HOTWATER_BOOST": HOTWATER_BOOST,
+            "QM_VENTILATION_BOOST": VENTILATION_BOOST,
+            "QM_ONE_DAY_AWAY": ONE_DAY_AWAY,
+            "QM_SYSTEM_OFF": SYSTEM_OFF,
+            "QM_ONE_DAY_AT_HOME": ONE_DAY_AT_HOME,
+            "QM_PARTY": PARTY,
+            "QM_HOLIDAY": HOLIDAY,
+            "QM_QUICK_VETO": QUICK_VETO,
+            "QM_COOLING_FOR_X_DAYS": COOLING_FOR_X_DAYS,
+        }
+    )
+
+    BY_NAME: Mapping[str, QuickMode] = _VALUES
+    """Read-only mapping of all :class:`QuickMode` by name. Unlike
+    :func:`get`, the returned quick modes don't carry any duration."""
+
+    _FOR_ZONE = tuple(qm for qm in _VALUES.values() if qm.applies_to & ZONE)
+    _FOR_ROOM = tuple(qm for qm in _VALUES.values() if qm.applies_to & ROOM)
+    _FOR_DHW = tuple(qm for qm in _VALUES.values() if qm.applies_to & DHW)
+    _FOR_VENTILATION = tuple(qm for qm in _VALUES.values() if qm.applies_to & VENTILATION)
 
     @classmethod
     def for_zone(cls) -> List[QuickMode]:
@@ -154,13 +214,7 @@ class QuickModes:
             A list of quick mode applicable for
             :class:`~pymultimatic.model.component.Zone`.
         """
-        sub_list = []
-
-        for quick_mode in cls._VALUES.values():
-            if quick_mode.for_zone:
-                sub_list.append(quick_mode)
-
-        return sub_list
+        return list(cls._FOR_ZONE)
 
     @classmethod
     def for_room(cls) -> List[QuickMode]:
@@ -171,13 +225,7 @@ class QuickModes:
             A list of quick mode applicable for
             :class:`~pymultimatic.model.component.Room`.
         """
-        sub_list = []
-
-        for quick_mode in cls._VALUES.values():
-            if quick_mode.for_room:
-                sub_list.append(quick_mode)
-
-        return sub_list
+        return list(cls._FOR_ROOM)
 
     @classmethod
     def for_dhw(cls) -> List[QuickMode]:
@@ -190,13 +238,7 @@ class QuickModes:
             :class:`~pymultimatic.model.component.HotWater` and
             :class:`~pymultimatic.model.component.Circulation`.
         """
-        sub_list = []
-
-        for quick_mode in cls._VALUES.values():
-            if quick_mode.for_dhw:
-                sub_list.append(quick_mode)
-
-        return sub_list
+        return list(cls._FOR_DHW)
 
     @classmethod
     def for_ventilation(cls) -> List[QuickMode]:
@@ -207,16 +249,10 @@ class QuickModes:
             A list of quick mode applicable for
             :class:`~pymultimatic.model.component.Ventilation`.
         """
-        sub_list = []
-
-        for quick_mode in cls._VALUES.values():
-            if quick_mode.for_ventilation:
-                sub_list.append(quick_mode)
-
-        return sub_list
+        return list(cls._FOR_VENTILATION)
 
     @classmethod
-    def get(cls, name: str, duration: Optional[int] = None) -> QuickMode:
+    def get(cls, name: str, duration: Optional[int] = None) -> Optional[QuickMode]:
         """Get :class:`QuickMode` by name.
 
         Args:
@@ -226,7 +262,9 @@ class QuickModes:
         Returns:
             The corresponding operating mode or None
         """
-        value: QuickMode = cls._VALUES[name]
+        value = cls._VALUES.get(name)
+        if value is None:
+            return None
         return QuickMode(
             value.name,
             value.for_zone,
@@ -237,7 +275,7 @@ class QuickModes:
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class HolidayMode:
     """Represents system's holiday mode.
 
@@ -264,7 +302,19 @@ class HolidayMode:
     def active_mode(self) -> Optional[ActiveMode]:
         """Optional[ActiveMode]: Get the :class:`ActiveMode` from holiday mode,
         if `is_applied`."""
-        if self.is_applied:
+        return self.active_mode_on(date.today())
+
+    def active_mode_on(self, today: date) -> Optional[ActiveMode]:
+        """Same as :attr:`active_mode` but for the given day.
+
+        Args:
+            today (date): The day to get the active mode for.
+
+        Returns:
+            Optional[ActiveMode]: The active mode, if the holiday mode is
+            applied on that day.
+        """
+        if self.is_applied_on(today):
             return ActiveMode(self.target, QuickModes.HOLIDAY)
         return None
 
@@ -277,9 +327,19 @@ class HolidayMode:
             Use this to know if the holiday mode is active and applied to the
             system.
         """
-        return (
-            self.is_active
-            and self.start_date is not None
-            and self.end_date is not None
-            and self.start_date <= date.today() <= self.end_date
-        )
+        return self.is_applied_on(date.today())
+
+    def is_applied_on(self, today: date) -> bool:
+        """Same as :attr:`is_applied` but for the given day, so the current
+        date can be computed once when checking many components. The holiday
+        flag and dates are checked before the day.
+
+        Args:
+            today (date): The day to check.
+
+        Returns:
+            bool: Whether the holiday mode is applied on that day.
+        """
+        if not (self.is_active and self.start_date is not None and self.end_date is not None):
+            return False
+        return self.start_date <= today <= self.end_date
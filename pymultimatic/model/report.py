@@ -5,7 +5,7 @@ from typing import Optional
 import attr
 
 
-@attr.s
+@attr.s(slots=True)
 class Report:
     """Represent a live report sensor."""
 
@@ -17,7 +17,7 @@ class Report:
     device_name = attr.ib(type=Optional[str], default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class EmfReport:
     """Represent an emf report."""
 
@@ -7,7 +7,7 @@ import attr
 from . import ActiveMode, Component, Function, OperatingModes, constants
 
 
-@attr.s
+@attr.s(slots=True)
 class Device:
     """This is a physical device inside a :class:`Room`. It can be a VR50
     VR51 or VR52.
@@ -74,14 +74,26 @@ class Room(Function, Component):
         for this function. All operating modes are handled,
         **but not quick veto nor quick mode.**
         """
+        return self.active_mode_at(datetime.now())
+
+    def active_mode_at(self, now: datetime) -> ActiveMode:
+        """Same as :attr:`active_mode`, but using the given time to look up
+        the time program.
+
+        Args:
+            now (datetime): The time to get the active mode for.
+
+        Returns:
+            ActiveMode: The active mode.
+        """
         if self.quick_veto:
             mode = ActiveMode(self.quick_veto.target, OperatingModes.QUICK_VETO)
 
-        elif self.operating_mode == OperatingModes.AUTO:
-            setting = self.time_program.get_for(datetime.now())
+        elif self.operating_mode is OperatingModes.AUTO:
+            setting = self.time_program.get_for(now)
             mode = ActiveMode(setting.target_temperature, OperatingModes.AUTO, setting.setting)
 
-        elif self.operating_mode == OperatingModes.OFF:
+        elif self.operating_mode is OperatingModes.OFF:
             mode = ActiveMode(self.MIN_TARGET_TEMP, OperatingModes.OFF)
         else:  # MODE_MANUAL
             mode = ActiveMode(self.target_high, OperatingModes.MANUAL)
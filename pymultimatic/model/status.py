@@ -1,11 +1,44 @@
 """Grouping status"""
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import Any, List, Optional
 
 import attr
 
 
-@attr.s
+class OnlineStatus(str, Enum):
+    """Connection status of the system, as sent by the API."""
+
+    ONLINE = "ONLINE"
+    OFFLINE = "OFFLINE"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+class UpdateStatus(str, Enum):
+    """Firmware update status of the system, as sent by the API."""
+
+    UPDATE_NOT_PENDING = "UPDATE_NOT_PENDING"
+    UPDATE_PENDING = "UPDATE_PENDING"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+_ONLINE_STATUSES = {status.value: status for status in OnlineStatus}
+_UPDATE_STATUSES = {status.value: status for status in UpdateStatus}
+
+
+def _to_online_status(value: Any) -> Any:
+    return _ONLINE_STATUSES.get(value, value)
+
+
+def _to_update_status(value: Any) -> Any:
+    return _UPDATE_STATUSES.get(value, value)
+
+
+@attr.s(slots=True)
 class Error:
     """Errors coming from your system.
 
@@ -24,7 +57,7 @@ class Error:
     timestamp = attr.ib(type=datetime)
 
 
-@attr.s
+@attr.s(slots=True)
 class BoilerStatus(Error):
     """Status of the boiler. This is sent with an error format, but in this
     case, it's more like a status.
@@ -39,33 +72,42 @@ class BoilerStatus(Error):
     @property
     def is_error(self) -> bool:
         """bool: Checks if there is an error at boiler side."""
-        return self.status_code is not None and (
-            self.status_code.startswith("F") or self.status_code == "con"
-        )
+        code = self.status_code
+        return code is not None and (code[:1] == "F" or code == "con")
 
 
-@attr.s
+@attr.s(slots=True)
 class HvacStatus:
     """HVAC status.
 
     Args:
-        online (str): Indicate if the system is connected to the cloud.
-        update (str): Indicate if there is available update.
+        online (str): Indicate if the system is connected to the cloud. Known
+            values are stored as :class:`OnlineStatus` members.
+        update (str): Indicate if there is available update. Known values are
+            stored as :class:`UpdateStatus` members.
         boiler_status (BoilerStatus): Status of the boiler.
         errors (List[Error]): If there are errors, you can find them here.
     """
 
-    online = attr.ib(type=str)
-    update = attr.ib(type=str)
+    online = attr.ib(type=str, converter=_to_online_status, on_setattr=attr.setters.convert)
+    update = attr.ib(type=str, converter=_to_update_status, on_setattr=attr.setters.convert)
     boiler_status = attr.ib(type=Optional[BoilerStatus], default=None)
-    errors = attr.ib(type=List[Error], default=[])
+    errors = attr.ib(type=List[Error], default=attr.Factory(list))
 
     @property
     def is_online(self) -> bool:
         """bool: Checks if the system is connected to the internet."""
-        return self.online == "ONLINE"
+        return self.online is OnlineStatus.ONLINE
 
     @property
     def is_up_to_date(self) -> bool:
         """bool: Checks if the system is up to date."""
-        return self.update == "UPDATE_NOT_PENDING"
+        return self.update is UpdateStatus.UPDATE_NOT_PENDING
+
+    @property
+    def any_error(self) -> bool:
+        """bool: Checks if the system reports errors, either in :attr:`errors`
+        or through the :attr:`boiler_status`."""
+        if self.errors:
+            return True
+        return self.boiler_status is not None and self.boiler_status.is_error
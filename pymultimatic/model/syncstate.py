@@ -1,22 +1,43 @@
 """state module"""
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
 import attr
 
-PENDING = "PENDING"
+
+class SyncStates(str, Enum):
+    """Resource states, as sent by the API."""
+
+    PENDING = "PENDING"
+    SYNCED = "SYNCED"
+    OUTDATED = "OUTDATED"
+    INITIALIZING = "INITIALIZING"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+PENDING = SyncStates.PENDING
 """Resource is being updated."""
 
-SYNCED = "SYNCED"
+SYNCED = SyncStates.SYNCED
 """Resource is sync."""
 
-OUTDATED = "OUTDATED"
+OUTDATED = SyncStates.OUTDATED
 """Resource is outdated."""
 
-INITIALIZING = "INITIALIZING"
+INITIALIZING = SyncStates.INITIALIZING
 """Resource is initializing."""
 
+_SYNC_STATES = {state.value: state for state in SyncStates}
+
+
+def _to_sync_state(value: Any) -> Any:
+    return _SYNC_STATES.get(value, value)
+
 
-@attr.s
+@attr.s(slots=True)
 class SyncState:
     """Sync state coming from the API.
     In the vaillant API, most resource you can ask for are flagged with a
@@ -24,31 +45,32 @@ class SyncState:
     for is synced or not.
 
     Args:
-        state (str): Sate coming from the API.
+        state (str): Sate coming from the API. Known values are stored as
+            :class:`SyncStates` members.
         timestamp (datetime): state's last update.
         resource_link (str): Link to the resource the state is talking about.
     """
 
-    state = attr.ib(type=str)
+    state = attr.ib(type=str, converter=_to_sync_state, on_setattr=attr.setters.convert)
     timestamp = attr.ib(type=datetime)
     resource_link = attr.ib(type=str)
 
     @property
     def is_synced(self) -> bool:
         """bool: Check if state is synced."""
-        return self.state == SYNCED
+        return self.state is SYNCED
 
     @property
     def is_pending(self) -> bool:
         """bool: Check if state is pending."""
-        return self.state == PENDING
+        return self.state is PENDING
 
     @property
     def is_outdated(self) -> bool:
         """bool: Check if state is outdated."""
-        return self.state == OUTDATED
+        return self.state is OUTDATED
 
     @property
     def is_init(self) -> bool:
         """bool: Check if state is initializing."""
-        return self.state == INITIALIZING
+        return self.state is INITIALIZING
@@ -1,5 +1,6 @@
 """Full system coming from vaillant API."""
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 import attr
 
@@ -7,6 +8,7 @@ from .. import utils
 from . import (
     ActiveMode,
     Circulation,
+    Component,
     Dhw,
     FacilityDetail,
     HolidayMode,
@@ -20,7 +22,7 @@ from . import (
 )
 
 
-@attr.s
+@attr.s(slots=True)
 class System:
     """This class represents the main class to manipulate vaillant system. It
     groups all the information about the system.
@@ -40,19 +42,72 @@ class System:
         gateway (str): The gateway type
     """
 
-    holiday = attr.ib(type=HolidayMode, default=HolidayMode(False))
+    holiday = attr.ib(type=HolidayMode, default=attr.Factory(lambda: HolidayMode(False)))
     quick_mode = attr.ib(type=Optional[QuickMode], default=None)
-    zones = attr.ib(type=List[Zone], default=[])
-    rooms = attr.ib(type=List[Room], default=[])
+    zones = attr.ib(type=List[Zone], default=attr.Factory(list))
+    rooms = attr.ib(type=List[Room], default=attr.Factory(list))
     dhw = attr.ib(type=Optional[Dhw], default=None)
-    reports = attr.ib(type=List[Report], default=[])
+    reports = attr.ib(type=List[Report], default=attr.Factory(list))
     hvac_status = attr.ib(type=HvacStatus, default=None)
     facility_detail = attr.ib(type=FacilityDetail, default=None)
     outdoor_temperature = attr.ib(type=Optional[float], default=None)
     ventilation = attr.ib(type=Optional[Ventilation], default=None)
     gateway = attr.ib(type=str, default=None)
 
-    def get_active_mode_zone(self, zone: Zone) -> Optional[ActiveMode]:
+    def get_active_mode(
+        self, comp: Optional[Component], now: Optional[datetime] = None
+    ) -> Optional[ActiveMode]:
+        """Get the current
+        :class:`~pymultimatic.model.mode.ActiveMode` for any component of
+        the system (:class:`~pymultimatic.model.component.Zone`,
+        :class:`~pymultimatic.model.component.Room`,
+        :class:`~pymultimatic.model.component.HotWater`,
+        :class:`~pymultimatic.model.component.Circulation` or
+        :class:`~pymultimatic.model.Ventilation`). This is the only way to
+        get the real one.
+
+        Args:
+            comp (Component): The component you want the active mode for.
+            now (datetime): Time to get the active mode for, defaults to the
+                current time. Pass the same value when looping over
+                components.
+
+        Returns:
+            ActiveMode: The active mode.
+        """
+        return utils.active_mode_for(comp, self.holiday, self.quick_mode, now)
+
+    def get_active_modes(self) -> List[Tuple[Component, Optional[ActiveMode]]]:
+        """Get the current :class:`~pymultimatic.model.mode.ActiveMode` of
+        every component of the system, all evaluated at the same time.
+
+        Components are returned with their active mode, zones first, then
+        rooms, hot water, circulation and ventilation. Components are
+        mutable, thus not hashable, that's why a list is returned rather than
+        a dict.
+
+        Returns:
+            List[Tuple[Component, Optional[ActiveMode]]]: The components and
+            their active mode.
+        """
+        components: List[Component] = [*self.zones, *self.rooms]
+        if self.dhw:
+            if self.dhw.hotwater:
+                components.append(self.dhw.hotwater)
+            if self.dhw.circulation:
+                components.append(self.dhw.circulation)
+        if self.ventilation:
+            components.append(self.ventilation)
+
+        holiday = self.holiday
+        quick_mode = self.quick_mode
+        now = datetime.now()
+        active_mode_for = utils.active_mode_for
+        return [(comp, active_mode_for(comp, holiday, quick_mode, now)) for comp in components]
+
+    def get_active_mode_zone(
+        self, zone: Zone, now: Optional[datetime] = None
+    ) -> Optional[ActiveMode]:
         """Get the current
         :class:`~pymultimatic.model.mode.ActiveMode` for a
         :class:`~pymultimatic.model.component.Zone`. This is the only way to
@@ -60,13 +115,17 @@ class System:
 
         Args:
             zone (Zone): The zone you want the active mode for.
+            now (datetime): Time to get the active mode for, defaults to the
+                current time.
 
         Returns:
             ActiveMode: The active mode.
         """
-        return utils.active_mode_for(zone, self.holiday, self.quick_mode)
+        return self.get_active_mode(zone, now)
 
-    def get_active_mode_room(self, room: Room) -> Optional[ActiveMode]:
+    def get_active_mode_room(
+        self, room: Room, now: Optional[datetime] = None
+    ) -> Optional[ActiveMode]:
         """Get the current
         :class:`~pymultimatic.model.mode.ActiveMode` for a
         :class:`~pymultimatic.model.component.Room`. This is the only way to
@@ -74,11 +133,13 @@ class System:
 
         Args:
             room (Room): The room you want the active mode for.
+            now (datetime): Time to get the active mode for, defaults to the
+                current time.
 
         Returns:
             ActiveMode: The active mode.
         """
-        return utils.active_mode_for(room, self.holiday, self.quick_mode)
+        return self.get_active_mode(room, now)
 
     def get_active_mode_circulation(
         self, circulation: Optional[Circulation] = None
@@ -99,7 +160,7 @@ class System:
         if not circulation and self.dhw and self.dhw.circulation:
             circulation = self.dhw.circulation
 
-        return utils.active_mode_for(circulation, self.holiday, self.quick_mode)
+        return self.get_active_mode(circulation)
 
     def get_active_mode_hot_water(
         self, hot_water: Optional[HotWater] = None
@@ -120,7 +181,7 @@ class System:
         if not hot_water and self.dhw and self.dhw.hotwater:
             hot_water = self.dhw.hotwater
 
-        return utils.active_mode_for(hot_water, self.holiday, self.quick_mode)
+        return self.get_active_mode(hot_water)
 
     def get_active_mode_ventilation(self) -> Optional[ActiveMode]:
         """Get the current
@@ -131,4 +192,4 @@ class System:
         Returns:
             ActiveMode: The active mode.
         """
-        return utils.active_mode_for(self.ventilation, self.holiday, self.quick_mode)
+        return self.get_active_mode(self.ventilation)
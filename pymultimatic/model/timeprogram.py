@@ -1,9 +1,8 @@
 """Groups all time program related functionality. Time program is used when
 :class:`~pymultimatic.model.mode.OperatingModes.AUTO` operation mode is
 activated."""
-import copy
-import re
-from datetime import datetime, timedelta
+from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 import attr
@@ -13,20 +12,43 @@ from . import SettingMode
 
 def _to_absolute_minutes(start_time: str) -> int:
     """Convert hh:mm to absolute minutes."""
-    split = start_time.split(":")
-    hour = int(split[0]) * 60
-    minute = int(split[1])
-    return hour + minute
+    colon = start_time.index(":")
+    # validated times always end with the two minute digits
+    return int(start_time[:colon]) * 60 + int(start_time[-2:])
+
+
+_BY_START = attrgetter("absolute_minutes")
+
+_DAYS_OF_WEEK = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+"""Day names used as keys of :attr:`TimeProgram.days`, indexed by
+:meth:`datetime.weekday`."""
+
+
+def _day_name(search_date: datetime, offset: int = 0) -> str:
+    """Get the day name of ``search_date`` shifted by ``offset`` days."""
+    return _DAYS_OF_WEEK[(search_date.weekday() + offset) % 7]
+
+
+def _bisect_left(settings: List["TimePeriodSetting"], abs_minutes: int) -> int:
+    """Get the index of the first setting starting at or after
+    ``abs_minutes``. ``settings`` must be sorted by start time."""
+    low, high = 0, len(settings)
+    while low < high:
+        mid = (low + high) // 2
+        if settings[mid].absolute_minutes < abs_minutes:
+            low = mid + 1
+        else:
+            high = mid
+    return low
 
 
 def _to_time(minutes: int) -> str:
     """Convert absolute minutes to hh:mm."""
-    hour = minutes // 60
-    minute = minutes % 60
-    return f"{hour:02n}:{minute:02n}"
+    hour, minute = divmod(minutes, 60)
+    return f"{hour:02d}:{minute:02d}"
 
 
-@attr.s
+@attr.s(frozen=True, slots=True)
 class TimePeriodSetting:
     """This is a period setting, defining what the
     :class:`~pymultimatic.model.component.Component` should do when on
@@ -43,6 +65,10 @@ class TimePeriodSetting:
         setting (SettingMode): The setting configured, see
             :class:`~pymultimatic.model.mode.SettingModes`, this is not
             available for a :class:`~pymultimatic.model.component.Room`.
+
+    Note:
+        Settings are immutable, :class:`TimeProgram` returns the instances it
+        holds rather than copies.
     """
 
     start_time = attr.ib(type=str)
@@ -56,17 +82,35 @@ class TimePeriodSetting:
     """Represents :attr:`start_time` in absolute minute. hours * 60 + minutes.
     This is more convenient to compare TimePeriodSetting using this."""
     end_time = attr.ib(type=str, default=None)
+    end_absolute_minutes = attr.ib(type=Optional[int], init=False, eq=False, repr=False)
+    """Represents :attr:`end_time` in absolute minute, None when there is no
+    end time."""
 
     def __attrs_post_init__(self) -> None:
-        self.absolute_minutes = _to_absolute_minutes(self.start_time)
-        self.hour = int(self.start_time.split(":")[0])
-        self.minute = int(self.start_time.split(":")[1])
+        # start_time is validated at this point: H:MM or HH:MM
+        start_time = self.start_time
+        colon = start_time.find(":")
+        hour = int(start_time[:colon])
+        minute = int(start_time[-2:])
+        object.__setattr__(self, "hour", hour)
+        object.__setattr__(self, "minute", minute)
+        object.__setattr__(self, "absolute_minutes", hour * 60 + minute)
+        end_time = self.end_time
+        object.__setattr__(
+            self,
+            "end_absolute_minutes",
+            _to_absolute_minutes(end_time) if end_time is not None else None,
+        )
 
     @staticmethod
     def _validate_time(value: Any) -> None:
-        validator = re.compile("[0-9]{1,2}:[0-9]{2}")
-        if not validator.match(value):
+        # H:MM or HH:MM
+        colon = value.find(":") if isinstance(value, str) else -1
+        if not 1 <= colon <= 2 or len(value) != colon + 3:
             raise ValueError(value)
+        for char in value[:colon] + value[-2:]:
+            if not "0" <= char <= "9":
+                raise ValueError(value)
 
     @start_time.validator
     def _validate_start_time(self, attribute: Any, value: Any) -> None:
@@ -78,13 +122,8 @@ class TimePeriodSetting:
         if value is not None:
             self._validate_time(value)
 
-    def __deepcopy__(self, memodict: Any = None) -> "TimePeriodSetting":
-        return TimePeriodSetting(
-            self.start_time, self.target_temperature, self.setting, self.end_time
-        )
-
 
-@attr.s
+@attr.s(slots=True)
 class TimeProgramDay:
     """This is a day, this is basically a list of :class:`TimePeriodSetting`.
 
@@ -101,16 +140,16 @@ class TimeProgramDay:
             setting_mode_for_completion (SettingMode): mode for empty periods
         """
         # Sorted the configuration to find the empty periods
-        settings = sorted(self.settings, key=lambda period: period.absolute_minutes)
+        self.settings.sort(key=_BY_START)
         last_end_time_absolute_minutes = 0
         to_add = []
 
-        for setting in settings:
+        for setting in self.settings:
             if setting.absolute_minutes - last_end_time_absolute_minutes > 0:
                 start = _to_time(last_end_time_absolute_minutes)
                 end = _to_time(setting.absolute_minutes)
                 to_add.append(TimePeriodSetting(start, None, setting_mode_for_completion, end))
-            last_end_time_absolute_minutes = _to_absolute_minutes(setting.end_time)
+            last_end_time_absolute_minutes = setting.end_absolute_minutes
 
         # End of day completion if necessary
         if last_end_time_absolute_minutes < 1440:
@@ -119,11 +158,12 @@ class TimeProgramDay:
             )
             to_add.append(TimePeriodSetting(start, None, setting_mode_for_completion, "24:00"))
 
+        # Both lists are sorted, timsort merges the two runs in linear time
         self.settings.extend(to_add)
-        self.settings = sorted(self.settings, key=lambda period: period.absolute_minutes)
+        self.settings.sort(key=_BY_START)
 
 
-@attr.s
+@attr.s(slots=True)
 class TimeProgram:
     """This is the full time program, a week, reflecting the configuration done
     through mobile app.
@@ -146,32 +186,25 @@ class TimeProgram:
             TimePeriodSetting: The corresponding setting.
         """
         if self.days:
-            day = search_date.strftime("%A").lower()
-            day_before = (search_date - timedelta(days=1)).strftime("%A").lower()
-            time = str(search_date.hour) + ":" + str(search_date.minute)
-
-            abs_minutes = _to_absolute_minutes(time)
-            tp_day = self.days.get(day)
-            tp_day_before = self.days.get(day_before)
+            abs_minutes = search_date.hour * 60 + search_date.minute
+            tp_day = self.days.get(_day_name(search_date))
+            tp_day_before = self.days.get(_day_name(search_date, -1))
 
             if tp_day and tp_day_before:
                 # if given hour:minute is before the first setting of the day,
                 # get last setting of the previous day
                 if abs_minutes < tp_day.settings[0].absolute_minutes:
-                    return copy.deepcopy(tp_day_before.settings[-1])
+                    return tp_day_before.settings[-1]
 
-                idx: int = 0
-                max_len: int = len(tp_day.settings)
-                while idx < max_len and abs_minutes > tp_day.settings[idx].absolute_minutes:
-                    idx += 1
-
-                if not idx == max_len:
-                    # At this point, we went 1 step too far, so idx - 1
-                    return copy.deepcopy(tp_day.settings[idx - 1])
+                idx = _bisect_left(tp_day.settings, abs_minutes)
+                if not idx == len(tp_day.settings):
+                    # idx is the first setting starting at or after the given
+                    # time, so the running one is the previous
+                    return tp_day.settings[idx - 1]
 
                 # if no match a this point, it means search date is after the last
                 # setting of the day
-                return copy.deepcopy(tp_day.settings[-1])
+                return tp_day.settings[-1]
         return None
 
     def get_next(self, search_date: datetime) -> TimePeriodSetting:
@@ -192,28 +225,15 @@ class TimeProgram:
         Returns:
             TimePeriodSetting: The corresponding setting.
         """
-        day = search_date.strftime("%A").lower()
-        day_after = (search_date + timedelta(days=1)).strftime("%A").lower()
-        time = str(search_date.hour) + ":" + str(search_date.minute)
-
-        abs_minutes = _to_absolute_minutes(time)
-        tp_day = self.days[day]
-        tp_day_after = self.days[day_after]
-
-        # if given hour:minute is before the first setting of the day,
-        # get the first setting of the day
-        if abs_minutes < tp_day.settings[0].absolute_minutes:
-            return copy.deepcopy(tp_day.settings[0])
-
-        idx: int = 0
-        max_len: int = len(tp_day.settings)
-        while idx < max_len and abs_minutes > tp_day.settings[idx].absolute_minutes:
-            idx += 1
+        abs_minutes = search_date.hour * 60 + search_date.minute
+        tp_day = self.days[_day_name(search_date)]
 
-        if not idx == max_len:
-            # At this point, we are on next setting, so it's fine
-            return copy.deepcopy(tp_day.settings[idx])
+        # first setting starting at or after the given time, if it's before
+        # the first setting of the day, this is the first setting of the day
+        idx = _bisect_left(tp_day.settings, abs_minutes)
+        if idx < len(tp_day.settings):
+            return tp_day.settings[idx]
 
         # if no match a this point, it means search date is after the last
         # setting of the day, so next one, is the first setting of the next day
-        return copy.deepcopy(tp_day_after.settings[0])
+        return self.days[_day_name(search_date, 1)].settings[0]
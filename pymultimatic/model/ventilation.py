@@ -19,9 +19,9 @@ class Ventilation(Function, Component):
     temperature = attr.ib(default=None, init=False)
 
     def _active_mode(self) -> ActiveMode:
-        if self.operating_mode == OperatingModes.OFF:
+        if self.operating_mode is OperatingModes.OFF:
             mode = ActiveMode(Ventilation.MIN_LEVEL, OperatingModes.OFF)
-        elif self.operating_mode == OperatingModes.DAY:
+        elif self.operating_mode is OperatingModes.DAY:
             mode = ActiveMode(self.target_high, OperatingModes.DAY)
         else:  # MODE_NIGHT
             mode = ActiveMode(self.target_low, OperatingModes.NIGHT)
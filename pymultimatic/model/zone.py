@@ -1,4 +1,5 @@
 """Groups everything related to a zone."""
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
@@ -33,13 +34,15 @@ class ZoneHeating(Function):
         OperatingModes.TIME_CONTROLLED,
     ]
 
+    _TARGET_HIGH_MODES = frozenset((OperatingModes.DAY, OperatingModes.MANUAL))
+    """Modes running at :attr:`target_high`."""
+
     def _active_mode(self) -> ActiveMode:
-        if self.operating_mode == OperatingModes.OFF:
+        operating_mode = self.operating_mode
+        if operating_mode in self._TARGET_HIGH_MODES:
+            mode = ActiveMode(self.target_high, operating_mode)
+        elif operating_mode is OperatingModes.OFF:
             mode = ActiveMode(constants.FROST_PROTECTION_TEMP, OperatingModes.OFF)
-        elif self.operating_mode == OperatingModes.DAY:
-            mode = ActiveMode(self.target_high, OperatingModes.DAY)
-        elif self.operating_mode == OperatingModes.MANUAL:
-            mode = ActiveMode(self.target_high, OperatingModes.MANUAL)
         else:  # MODE_NIGHT
             mode = ActiveMode(self.target_low, OperatingModes.NIGHT)
         return mode
@@ -51,7 +54,7 @@ class ZoneCooling(Function):
     MODES = [OperatingModes.AUTO, OperatingModes.ON, OperatingModes.OFF]
 
     def _active_mode(self) -> ActiveMode:
-        if self.operating_mode == OperatingModes.OFF:
+        if self.operating_mode is OperatingModes.OFF:
             mode = ActiveMode(None, OperatingModes.OFF)
         else:  # MODE ON
             mode = ActiveMode(self.target_high, OperatingModes.ON)
@@ -103,17 +106,29 @@ class Zone(Component):
 
     @property
     def active_mode(self) -> Optional[ActiveMode]:
+        return self.active_mode_at(datetime.now())
+
+    def active_mode_at(self, now: datetime) -> Optional[ActiveMode]:
+        """Same as :attr:`active_mode`, but using the given time to look up
+        the time program.
+
+        Args:
+            now (datetime): The time to get the active mode for.
+
+        Returns:
+            ActiveMode: The active mode.
+        """
         if self.quick_veto:
             return ActiveMode(self.quick_veto.target, OperatingModes.QUICK_VETO)
 
-        if self.active_function == ActiveFunction.COOLING and self.cooling:
-            return self.cooling.active_mode
-        if self.active_function == ActiveFunction.HEATING and self.heating:
-            return self.heating.active_mode
+        if self.active_function is ActiveFunction.COOLING and self.cooling:
+            return self.cooling.active_mode_at(now)
+        if self.active_function is ActiveFunction.HEATING and self.heating:
+            return self.heating.active_mode_at(now)
 
         if self.heating:
-            return self.heating.active_mode
+            return self.heating.active_mode_at(now)
 
         if self.cooling:
-            return self.cooling.active_mode
+            return self.cooling.active_mode_at(now)
         return None
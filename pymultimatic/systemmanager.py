@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from datetime import date, timedelta, datetime
+from functools import wraps
 from typing import Any, Callable, List, Optional, Tuple, Type
 
 from aiohttp import ClientSession
@@ -38,6 +39,7 @@ def ignore_http_409(return_value: Any = None) -> Callable[..., Any]:
     """Ignore ApiError if status code is 409."""
 
     def decorator(func: Callable[..., Any]) -> Any:
+        @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return await func(*args, **kwargs)
@@ -71,6 +73,7 @@ def retry_async(
     on_exceptions = on_exceptions + (ApiError,)
 
     def decorator(func: Callable[..., Any]) -> Any:
+        @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             _num_tries = num_tries
             last_response: Optional[str] = None
@@ -174,13 +177,13 @@ class SystemManager:
 
         (
             facilities,
-            full_system,
+            (full_system, zones, rooms),
             live_report,
             hvac_state,
             gateway_json,
         ) = await asyncio.gather(
             self._call_api(self.urls.facilities_list, schema=schemas.FACILITIES),
-            self._call_api(self.urls.system, schema=schemas.SYSTEM),
+            self._get_system_zones_and_rooms(),
             self._call_api(self.urls.live_report, schema=schemas.LIVE_REPORTS),
             self._call_api(self.urls.hvac, schema=schemas.HVAC),
             self._call_api(self.urls.gateway_type, schema=schemas.GATEWAY),
@@ -188,7 +191,6 @@ class SystemManager:
 
         hvac_status = mapper.map_hvac_status(hvac_state)
         holiday = mapper.map_holiday_mode_from_system(full_system)
-        zones = mapper.map_zones_from_system(full_system)
         outdoor_temp = mapper.map_outdoor_temp_from_system(full_system)
         quick_mode = mapper.map_quick_mode_from_system(full_system)
         ventilation = mapper.map_ventilation_from_system(full_system)
@@ -197,11 +199,6 @@ class SystemManager:
         facility_detail = mapper.map_facility_detail(facilities, self._serial)
         gateway = mapper.map_gateway(gateway_json)
 
-        rooms: List[Room] = []
-        if [z for z in zones if z.rbr]:
-            rooms_raw = await self._call_api(self.urls.rooms, schema=schemas.ROOM_LIST)
-            rooms = mapper.map_rooms(rooms_raw)
-
         return System(
             holiday=holiday,
             quick_mode=quick_mode,
@@ -563,7 +560,7 @@ class SystemManager:
             room_id (str): id of the room.
             new_mode (OperatingMode): The new mode to set.
         """
-        if new_mode in Room.MODES and new_mode != OperatingModes.QUICK_VETO:
+        if new_mode in Room.MODES and new_mode is not OperatingModes.QUICK_VETO:
             _LOGGER.debug(f"New mode is {new_mode.name}")
             await self._call_api(
                 self.urls.room_operating_mode,
@@ -662,7 +659,7 @@ class SystemManager:
             zone_id (str): id of the zone.
             new_mode (OperatingMode): The new mode to set.
         """
-        if zone_id and new_mode in ZoneHeating.MODES and new_mode != OperatingModes.QUICK_VETO:
+        if zone_id and new_mode in ZoneHeating.MODES and new_mode is not OperatingModes.QUICK_VETO:
             _LOGGER.debug(f"New mode is {new_mode}")
             await self._call_api(
                 self.urls.zone_heating_mode,
@@ -696,7 +693,7 @@ class SystemManager:
             zone_id (str): id of the zone.
             new_mode (OperatingMode): The new mode to set.
         """
-        if new_mode in ZoneCooling.MODES and new_mode != OperatingModes.QUICK_VETO:
+        if new_mode in ZoneCooling.MODES and new_mode is not OperatingModes.QUICK_VETO:
             _LOGGER.debug(f"New mode is {new_mode}")
             await self._call_api(
                 self.urls.zone_cooling_mode,
@@ -867,6 +864,20 @@ class SystemManager:
             payload={"datetime": dt.isoformat(timespec="microseconds")},
         )
 
+    async def _get_system_zones_and_rooms(self) -> Tuple[Any, List[Zone], List[Room]]:
+        """Get the raw system with its zones, then the rooms if a zone is
+        controlled by rooms. Chaining the rooms call here lets it run while the
+        other :meth:`get_system` calls are still pending."""
+        full_system = await self._call_api(self.urls.system, schema=schemas.SYSTEM)
+        zones = mapper.map_zones_from_system(full_system)
+
+        rooms: List[Room] = []
+        if any(zone.rbr for zone in zones):
+            rooms_raw = await self._call_api(self.urls.rooms, schema=schemas.ROOM_LIST)
+            rooms = mapper.map_rooms(rooms_raw)
+
+        return full_system, zones, rooms
+
     @staticmethod
     def _round(number: float) -> float:
         """round a float to the nearest 0.5, as vaillant API only accepts 0.5
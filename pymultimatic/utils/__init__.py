@@ -21,16 +21,35 @@ from pymultimatic.model import (
 
 
 def active_mode_for(
-    comp: Optional[Component], holiday: HolidayMode, quick_mode: Optional[QuickMode]
+    comp: Optional[Component],
+    holiday: HolidayMode,
+    quick_mode: Optional[QuickMode],
+    now: Optional[datetime] = None,
 ) -> Optional[ActiveMode]:
-    """Get active mode for a given component"""
+    """Get active mode for a given component.
+
+    ``now`` defaults to the current time; pass it when getting the active
+    mode of several components so they are all evaluated at the same time.
+    """
     if comp is not None:
-        return _method_by_component[comp.__class__.__name__](comp, holiday, quick_mode)
+        if now is None:
+            now = datetime.now()
+        return _method_by_component[comp.__class__.__name__](comp, holiday, quick_mode, now)
+    return None
+
+
+def _holiday_applied(holiday: HolidayMode, now: datetime) -> bool:
+    return bool(holiday) and holiday.is_applied_on(now.date())
+
+
+def _holiday_mode(holiday: HolidayMode, now: datetime) -> Optional[ActiveMode]:
+    if holiday:
+        return holiday.active_mode_on(now.date())
     return None
 
 
 def _active_mode_for_zone(
-    zone: Zone, holiday: HolidayMode, quick_mode: QuickMode
+    zone: Zone, holiday: HolidayMode, quick_mode: QuickMode, now: datetime
 ) -> Optional[ActiveMode]:
     """Get the current
     :class:`~pymultimatic.model.mode.ActiveMode` for a
@@ -43,41 +62,50 @@ def _active_mode_for_zone(
     Returns:
         ActiveMode: The active mode.
     """
-    mode: Optional[ActiveMode] = zone.active_mode
-
     # Holiday mode takes precedence over everything
-    if holiday and holiday.active_mode:
-        mode = holiday.active_mode
-
-    # Global system quick mode takes over zone settings
-    if quick_mode and quick_mode.for_zone:
-        if quick_mode in (
-            QuickModes.VENTILATION_BOOST,
-            QuickModes.ONE_DAY_AWAY,
-            QuickModes.SYSTEM_OFF,
-        ):
-            mode = ActiveMode(Zone.MIN_TARGET_HEATING_TEMP, quick_mode)
-
-        if quick_mode == QuickModes.ONE_DAY_AT_HOME:
-            if zone.heating:
-                time_program = _get_setting_for_sunday(zone.heating.time_program)
-                target_temp = zone.heating.target_high
-                if time_program.setting == SettingModes.NIGHT:
-                    target_temp = zone.heating.target_low
-                mode = ActiveMode(target_temp, quick_mode)
+    holiday_mode = _holiday_mode(holiday, now)
+    if holiday_mode:
+        return holiday_mode
 
-        if quick_mode == QuickModes.PARTY:
-            if zone.heating:
-                mode = ActiveMode(zone.heating.target_high, quick_mode)
+    mode: Optional[ActiveMode] = zone.active_mode_at(now)
 
-        if quick_mode == QuickModes.COOLING_FOR_X_DAYS and zone.cooling:
-            mode = ActiveMode(zone.cooling.target_high, quick_mode)
+    # Global system quick mode takes over zone settings, only quick modes
+    # applicable to zones are in the table
+    handler = _quick_mode_for_zone.get(quick_mode)
+    if handler:
+        mode = handler(zone, quick_mode, now) or mode
 
     return mode
 
 
+def _zone_min_target(zone: Zone, quick_mode: QuickMode, now: datetime) -> Optional[ActiveMode]:
+    return ActiveMode(Zone.MIN_TARGET_HEATING_TEMP, quick_mode)
+
+
+def _zone_one_day_at_home(zone: Zone, quick_mode: QuickMode, now: datetime) -> Optional[ActiveMode]:
+    if zone.heating:
+        time_program = _get_setting_for_sunday(zone.heating.time_program, now)
+        target_temp = zone.heating.target_high
+        if time_program.setting is SettingModes.NIGHT:
+            target_temp = zone.heating.target_low
+        return ActiveMode(target_temp, quick_mode)
+    return None
+
+
+def _zone_party(zone: Zone, quick_mode: QuickMode, now: datetime) -> Optional[ActiveMode]:
+    if zone.heating:
+        return ActiveMode(zone.heating.target_high, quick_mode)
+    return None
+
+
+def _zone_cooling(zone: Zone, quick_mode: QuickMode, now: datetime) -> Optional[ActiveMode]:
+    if zone.cooling:
+        return ActiveMode(zone.cooling.target_high, quick_mode)
+    return None
+
+
 def _active_mode_for_room(
-    room: Room, holiday: HolidayMode, quick_mode: QuickMode
+    room: Room, holiday: HolidayMode, quick_mode: QuickMode, now: datetime
 ) -> Optional[ActiveMode]:
     """Get the current
     :class:`~pymultimatic.model.mode.ActiveMode` for a
@@ -91,19 +119,20 @@ def _active_mode_for_room(
         ActiveMode: The active mode.
     """
     # Holiday mode takes precedence over everything
-    if holiday and holiday.active_mode:
-        return holiday.active_mode
+    holiday_mode = _holiday_mode(holiday, now)
+    if holiday_mode:
+        return holiday_mode
 
     # Global system quick mode takes over room settings
     if quick_mode and quick_mode.for_room:
         if quick_mode == QuickModes.SYSTEM_OFF:
             return ActiveMode(Room.MIN_TARGET_TEMP, quick_mode)
 
-    return room.active_mode
+    return room.active_mode_at(now)
 
 
 def _active_mode_for_circulation(
-    circulation: Circulation, holiday: HolidayMode, quick_mode: QuickMode
+    circulation: Circulation, holiday: HolidayMode, quick_mode: QuickMode, now: datetime
 ) -> Optional[ActiveMode]:
     """Get the current
     :class:`~pymultimatic.model.mode.ActiveMode` for a
@@ -118,19 +147,17 @@ def _active_mode_for_circulation(
     Returns:
         ActiveMode: The active mode.
     """
-    if holiday and holiday.active_mode:
-        active_mode = holiday.active_mode
-        active_mode.target = None
-        return active_mode
+    if _holiday_applied(holiday, now):
+        return ActiveMode(None, QuickModes.HOLIDAY)
 
     if quick_mode and quick_mode.for_dhw:
         return ActiveMode(None, quick_mode)
 
-    return circulation.active_mode
+    return circulation.active_mode_at(now)
 
 
 def _active_mode_for_hot_water(
-    hot_water: HotWater, holiday: HolidayMode, quick_mode: QuickMode
+    hot_water: HotWater, holiday: HolidayMode, quick_mode: QuickMode, now: datetime
 ) -> Optional[ActiveMode]:
     """Get the current
     :class:`~pymultimatic.model.mode.ActiveMode` for a
@@ -146,10 +173,8 @@ def _active_mode_for_hot_water(
         ActiveMode: The active mode.
     """
 
-    if holiday and holiday.active_mode:
-        active_mode = holiday.active_mode
-        active_mode.target = constants.FROST_PROTECTION_TEMP
-        return active_mode
+    if _holiday_applied(holiday, now):
+        return ActiveMode(constants.FROST_PROTECTION_TEMP, QuickModes.HOLIDAY)
 
     if quick_mode and quick_mode.for_dhw:
         if quick_mode == QuickModes.HOTWATER_BOOST:
@@ -164,11 +189,11 @@ def _active_mode_for_hot_water(
         if quick_mode == QuickModes.PARTY:
             return ActiveMode(hot_water.target_high, quick_mode)
 
-    return hot_water.active_mode
+    return hot_water.active_mode_at(now)
 
 
 def _active_mode_for_ventilation(
-    ventilation: Ventilation, holiday: HolidayMode, quick_mode: QuickMode
+    ventilation: Ventilation, holiday: HolidayMode, quick_mode: QuickMode, now: datetime
 ) -> Optional[ActiveMode]:
     """Get the current
     :class:`~pymultimatic.model.mode.ActiveMode` for a
@@ -178,12 +203,10 @@ def _active_mode_for_ventilation(
     Returns:
         ActiveMode: The active mode.
     """
-    mode: ActiveMode = ventilation.active_mode
+    if _holiday_applied(holiday, now):
+        return ActiveMode(Ventilation.MIN_LEVEL, QuickModes.HOLIDAY)
 
-    if holiday and holiday.active_mode:
-        active_mode = holiday.active_mode
-        active_mode.target = Ventilation.MIN_LEVEL
-        return active_mode
+    mode: ActiveMode = ventilation.active_mode_at(now)
 
     if quick_mode and quick_mode.for_ventilation:
         if quick_mode == QuickModes.VENTILATION_BOOST:
@@ -192,17 +215,30 @@ def _active_mode_for_ventilation(
             mode = ActiveMode(Ventilation.MIN_LEVEL, quick_mode)
         elif quick_mode == QuickModes.PARTY:
             return ActiveMode(ventilation.target_high, quick_mode)
-    else:
-        mode = ventilation.active_mode
     return mode
 
 
-def _get_setting_for_sunday(time_program: TimeProgram) -> Optional[TimePeriodSetting]:
-    today = datetime.now()
-    sunday = today - timedelta(days=today.weekday() - 6)
+def _get_setting_for_sunday(
+    time_program: TimeProgram, now: datetime
+) -> Optional[TimePeriodSetting]:
+    sunday = now - timedelta(days=now.weekday() - 6)
     return time_program.get_for(sunday)
 
 
+_ZoneHandler = Callable[[Zone, QuickMode, datetime], Optional[ActiveMode]]
+
+_quick_mode_for_zone: Dict[QuickMode, _ZoneHandler] = {
+    QuickModes.VENTILATION_BOOST: _zone_min_target,
+    QuickModes.ONE_DAY_AWAY: _zone_min_target,
+    QuickModes.SYSTEM_OFF: _zone_min_target,
+    QuickModes.ONE_DAY_AT_HOME: _zone_one_day_at_home,
+    QuickModes.PARTY: _zone_party,
+    QuickModes.COOLING_FOR_X_DAYS: _zone_cooling,
+}
+"""Quick modes changing the zone active mode, all of them are applicable to
+zones. Quick modes compare by name, so the copies returned by
+:meth:`QuickModes.get` are found as well."""
+
 _method_by_component: Dict[str, Callable[..., Optional[ActiveMode]]] = {
     Zone.__name__: _active_mode_for_zone,
     Room.__name__: _active_mode_for_room,
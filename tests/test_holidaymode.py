@@ -33,3 +33,13 @@ class HolidayModeTest(unittest.TestCase):
         end_date = today + timedelta(days=1)
         mode = HolidayMode(True, start_date, end_date, 15)
         self.assertTrue(mode.is_applied)
+
+    def test_is_applied_on(self) -> None:
+        """Test applied on a given day."""
+        start_date = date(2020, 7, 1)
+        end_date = date(2020, 7, 14)
+        mode = HolidayMode(True, start_date, end_date, 15)
+        self.assertTrue(mode.is_applied_on(date(2020, 7, 1)))
+        self.assertTrue(mode.is_applied_on(date(2020, 7, 14)))
+        self.assertFalse(mode.is_applied_on(date(2020, 7, 15)))
+        self.assertFalse(HolidayMode(False, start_date, end_date).is_applied_on(start_date))
@@ -19,6 +19,17 @@ class HotWaterTest(unittest.TestCase):
         self.assertEqual(hot_water.target_high, active_mode.target)
         self.assertIsNone(active_mode.sub)
 
+    def test_get_active_mode_manual(self) -> None:
+        """Test active mode manual."""
+        hot_water = _hotwater()
+        hot_water.operating_mode = OperatingModes.MANUAL
+
+        active_mode = hot_water.active_mode
+
+        self.assertEqual(OperatingModes.MANUAL, active_mode.current)
+        self.assertEqual(hot_water.target_high, active_mode.target)
+        self.assertIsNone(active_mode.sub)
+
     def test_get_active_mode_off(self) -> None:
         """Test active mode off."""
         hot_water = _hotwater()
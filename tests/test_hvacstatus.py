@@ -1,7 +1,8 @@
 """Tests for hvac status."""
 import unittest
+from datetime import datetime
 
-from pymultimatic.model import HvacStatus
+from pymultimatic.model import BoilerStatus, Error, HvacStatus, OnlineStatus, UpdateStatus
 
 
 class HvacStatusTest(unittest.TestCase):
@@ -26,3 +27,38 @@ class HvacStatusTest(unittest.TestCase):
         """Test online."""
         status = HvacStatus(online="", update="UPDATE_NOT_PENDING")
         self.assertTrue(status.is_up_to_date)
+
+    def test_known_values_stored_as_enum(self) -> None:
+        """Test raw API values are mapped to enum members."""
+        status = HvacStatus(online="ONLINE", update="UPDATE_PENDING")
+        self.assertIs(OnlineStatus.ONLINE, status.online)
+        self.assertIs(UpdateStatus.UPDATE_PENDING, status.update)
+        self.assertEqual("ONLINE", status.online)
+        self.assertEqual("ONLINE", str(status.online))
+        self.assertFalse(status.is_up_to_date)
+
+    def test_assigned_values_stored_as_enum(self) -> None:
+        """Test values assigned after construction are mapped too."""
+        status = HvacStatus(online="OFFLINE", update="UPDATE_PENDING")
+        status.online = "ONLINE"
+        status.update = "UPDATE_NOT_PENDING"
+        self.assertIs(OnlineStatus.ONLINE, status.online)
+        self.assertTrue(status.is_online)
+        self.assertTrue(status.is_up_to_date)
+
+    def test_any_error(self) -> None:
+        """Test errors and boiler status are both considered."""
+        status = HvacStatus(online="ONLINE", update="")
+        self.assertFalse(status.any_error)
+        status.boiler_status = BoilerStatus("boiler", "title", "F.28", "", datetime.now(), "")
+        self.assertTrue(status.any_error)
+        status.boiler_status = None
+        status.errors = [Error("boiler", "title", "code", "", datetime.now())]
+        self.assertTrue(status.any_error)
+
+    def test_errors_not_shared(self) -> None:
+        """Test default errors list is not shared between instances."""
+        status1 = HvacStatus(online="ONLINE", update="")
+        status2 = HvacStatus(online="ONLINE", update="")
+        status1.errors.append(Error("boiler", "title", "code", "", datetime.now()))
+        self.assertEqual([], status2.errors)
@@ -1,7 +1,9 @@
 """Test for quick mode."""
+import copy
+import pickle
 import unittest
 
-from pymultimatic.model import OperatingModes, QuickModes, SettingModes
+from pymultimatic.model import ActiveMode, OperatingModes, QuickModes, QuickVeto, SettingModes
 
 
 class ModeTest(unittest.TestCase):
@@ -13,3 +15,32 @@ class ModeTest(unittest.TestCase):
         }
 
         self.assertEqual(3, len(test))
+
+    def test_equality_is_identity(self) -> None:
+        self.assertEqual(OperatingModes.AUTO, OperatingModes.get("AUTO"))
+        self.assertNotEqual(OperatingModes.AUTO, OperatingModes.DAY)
+        self.assertEqual(SettingModes.ON, SettingModes.get("ON"))
+        self.assertNotEqual(SettingModes.ON, OperatingModes.ON)
+
+    def test_copy_keeps_singleton(self) -> None:
+        for mode in (OperatingModes.AUTO, SettingModes.NIGHT):
+            self.assertIs(mode, copy.copy(mode))
+            self.assertIs(mode, copy.deepcopy(mode))
+            self.assertIs(mode, pickle.loads(pickle.dumps(mode)))
+
+    def test_by_name_read_only(self) -> None:
+        self.assertIs(OperatingModes.AUTO, OperatingModes.BY_NAME["AUTO"])
+        self.assertIs(SettingModes.ON, SettingModes.BY_NAME["ON"])
+        self.assertIs(QuickModes.PARTY, QuickModes.BY_NAME["QM_PARTY"])
+        with self.assertRaises(TypeError):
+            OperatingModes.BY_NAME["AUTO"] = OperatingModes.DAY  # type: ignore
+
+    def test_former_attribute_names(self) -> None:
+        active_mode = ActiveMode(20, OperatingModes.AUTO, SettingModes.DAY)
+        self.assertEqual(20, active_mode.target_temperature)
+        self.assertIs(OperatingModes.AUTO, active_mode.current_mode)
+        self.assertIs(SettingModes.DAY, active_mode.sub_mode)
+
+        quick_veto = QuickVeto(duration=60, target=20)
+        self.assertEqual(60, quick_veto.remaining_duration)
+        self.assertEqual(20, quick_veto.target_temperature)
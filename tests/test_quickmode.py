@@ -1,7 +1,15 @@
 """Test for quick mode."""
 import unittest
 
-from pymultimatic.model import Circulation, HotWater, QuickModes, Room, Ventilation, Zone
+from pymultimatic.model import (
+    Circulation,
+    HotWater,
+    QuickModes,
+    Room,
+    Ventilation,
+    Zone,
+    quick_mode,
+)
 
 
 class QuickModeTest(unittest.TestCase):
@@ -34,3 +42,39 @@ class QuickModeTest(unittest.TestCase):
             self.assertEqual(mode.for_dhw, mode.is_for(Circulation()), mode)
             self.assertEqual(mode.for_dhw, mode.is_for(HotWater()), mode)
             self.assertEqual(mode.for_ventilation, mode.is_for(Ventilation()), mode)
+
+    def test_applies_to(self) -> None:
+        self.assertEqual(
+            quick_mode.ZONE | quick_mode.DHW | quick_mode.VENTILATION,
+            QuickModes.PARTY.applies_to,
+        )
+        self.assertEqual(0, QuickModes.QUICK_VETO.applies_to)
+        party = QuickModes.get("QM_PARTY", 5)
+        assert party is not None
+        self.assertEqual(QuickModes.PARTY.applies_to, party.applies_to)
+
+    def test_get(self) -> None:
+        party = QuickModes.get("QM_PARTY", 5)
+        self.assertEqual(QuickModes.PARTY, party)
+        assert party is not None
+        self.assertEqual(5, party.duration)
+        self.assertIsNone(QuickModes.get("QM_UNKNOWN"))
+
+    def test_copy_equal_but_not_identical(self) -> None:
+        party = QuickModes.get("QM_PARTY", 5)
+        self.assertIsNot(QuickModes.PARTY, party)
+        self.assertEqual(hash(QuickModes.PARTY), hash(party))
+        self.assertIn(party, {QuickModes.PARTY: None})
+
+    def test_is_for_subclass(self) -> None:
+        class SubZone(Zone):
+            pass
+
+        self.assertTrue(QuickModes.PARTY.is_for(SubZone()))
+        self.assertFalse(QuickModes.HOTWATER_BOOST.is_for(SubZone()))
+        self.assertNotIn(SubZone, quick_mode._FLAG_BY_TYPE)
+
+    def test_equality(self) -> None:
+        self.assertEqual(QuickModes.PARTY, quick_mode.QuickMode("QM_PARTY", True, False, True))
+        self.assertNotEqual(QuickModes.PARTY, QuickModes.SYSTEM_OFF)
+        self.assertNotEqual(QuickModes.PARTY, "QM_PARTY")
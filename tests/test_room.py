@@ -1,7 +1,8 @@
 """Test for rooms."""
 import unittest
+from datetime import datetime
 
-from pymultimatic.model import OperatingModes, Room
+from pymultimatic.model import OperatingModes, Room, TimePeriodSetting, TimeProgramDay
 from tests.conftest import _room
 
 
@@ -30,3 +31,13 @@ class RoomTest(unittest.TestCase):
         self.assertEqual(OperatingModes.OFF, active_mode.current)
         self.assertEqual(Room.MIN_TARGET_TEMP, active_mode.target)
         self.assertIsNone(active_mode.sub)
+
+    def test_get_active_mode_at(self) -> None:
+        """Test active mode at a given time."""
+        room = _room()
+        room.time_program.days["sunday"] = TimeProgramDay([TimePeriodSetting("00:00", 15, None)])
+
+        active_mode = room.active_mode_at(datetime(2020, 3, 1, 12, 0))  # a sunday
+
+        self.assertEqual(OperatingModes.AUTO, active_mode.current)
+        self.assertEqual(15, active_mode.target)
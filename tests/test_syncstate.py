@@ -1,7 +1,7 @@
 import unittest
 from datetime import datetime
 
-from pymultimatic.model import SyncState
+from pymultimatic.model import SyncState, SyncStates
 
 
 class StateTest(unittest.TestCase):
@@ -16,3 +16,19 @@ class StateTest(unittest.TestCase):
 
     def test_is_init(self) -> None:
         self.assertTrue(SyncState("INITIALIZING", datetime.now(), "link").is_init)
+
+    def test_unknown_state(self) -> None:
+        state = SyncState("UNKNOWN", datetime.now(), "link")
+        self.assertEqual("UNKNOWN", state.state)
+        self.assertFalse(state.is_synced)
+
+    def test_state_is_enum(self) -> None:
+        state = SyncState("SYNCED", datetime.now(), "link")
+        self.assertIs(SyncStates.SYNCED, state.state)
+        self.assertEqual("SYNCED", state.state)
+
+    def test_assigned_state_is_enum(self) -> None:
+        state = SyncState("PENDING", datetime.now(), "link")
+        state.state = "SYNCED"
+        self.assertIs(SyncStates.SYNCED, state.state)
+        self.assertTrue(state.is_synced)
@@ -19,6 +19,7 @@ from pymultimatic.model import (
     constants,
     TimeProgram,
 )
+from pymultimatic.utils import active_mode_for
 from tests.conftest import (
     _circulation,
     _hotwater,
@@ -280,6 +281,18 @@ class SystemTest(unittest.TestCase):
         self.assertEqual(QuickModes.HOLIDAY, active_mode.current)
         self.assertEqual(holiday.target, active_mode.target)
 
+    def test_get_active_mode_zone_holiday_mode_and_quick_mode(self) -> None:
+        """Test holiday mode takes precedence over quick mode for zone."""
+        holiday = HolidayMode(True, datetime.date.today(), datetime.date.today(), 10)
+
+        zone = _zone()
+        system = System(holiday=holiday, zones=[zone], quick_mode=QuickModes.PARTY)
+
+        active_mode = system.get_active_mode_zone(zone)
+
+        self.assertEqual(QuickModes.HOLIDAY, active_mode.current)
+        self.assertEqual(holiday.target, active_mode.target)
+
     def test_get_active_mode_zone_quick_mode_water_boost(self) -> None:
         """Test get active mode for zone with hot water boost."""
         zone = _zone()
@@ -355,6 +368,17 @@ class SystemTest(unittest.TestCase):
         self.assertEqual(QuickModes.PARTY, active_mode.current)
         self.assertEqual(zone.heating.target_high, active_mode.target)
 
+    def test_get_active_mode_zone_quick_mode_with_duration(self) -> None:
+        """Test get active mode for zone with a quick mode coming from the API."""
+        zone = _zone()
+        system = System(zones=[zone], quick_mode=QuickModes.get("QM_PARTY", 60))
+
+        active_mode = system.get_active_mode_zone(zone)
+
+        self.assertEqual(QuickModes.PARTY, active_mode.current)
+        self.assertIs(system.quick_mode, active_mode.current)
+        self.assertEqual(zone.heating.target_high, active_mode.target)
+
     def test_get_active_mode_zone_quick_mode_quick_veto(self) -> None:
         """Test get active mode for zone quick mode + quick veto."""
         quick_veto = QuickVeto(target=15)
@@ -606,3 +630,82 @@ class SystemTest(unittest.TestCase):
         active_mode = system.get_active_mode_circulation()
 
         self.assertEqual(OperatingModes.ON, active_mode.current)
+
+    def test_defaults_not_shared(self) -> None:
+        """Test mutable defaults are not shared between instances."""
+        system1 = System()
+        system2 = System()
+        system1.zones.append(_zone())
+        system1.holiday.is_active = True
+
+        self.assertEqual([], system2.zones)
+        self.assertFalse(system2.holiday.is_active)
+        self.assertIsNot(system1.rooms, system2.rooms)
+        self.assertIsNot(system1.reports, system2.reports)
+
+    def test_active_mode_for_given_time(self) -> None:
+        """Test holiday mode is checked against the given time."""
+        day = datetime.date(2020, 3, 1)
+        holiday = HolidayMode(True, day, day, 10)
+        room = _room()
+
+        active_mode = active_mode_for(room, holiday, None, datetime.datetime(2020, 3, 1, 12, 0))
+        self.assertEqual(QuickModes.HOLIDAY, active_mode.current)
+
+        active_mode = active_mode_for(room, holiday, None, datetime.datetime(2020, 3, 2, 12, 0))
+        self.assertEqual(OperatingModes.AUTO, active_mode.current)
+
+    def test_get_active_mode(self) -> None:
+        """Test get active mode for any component."""
+        room = _room()
+        zone = _zone()
+        dhw = Dhw(hotwater=_hotwater(), circulation=_circulation())
+        system = System(zones=[zone], rooms=[room], dhw=dhw, quick_mode=QuickModes.SYSTEM_OFF)
+
+        self.assertEqual(system.get_active_mode_room(room=room), system.get_active_mode(room))
+        self.assertEqual(system.get_active_mode_zone(zone=zone), system.get_active_mode(zone))
+        self.assertEqual(system.get_active_mode_hot_water(), system.get_active_mode(dhw.hotwater))
+        self.assertEqual(
+            system.get_active_mode_circulation(), system.get_active_mode(dhw.circulation)
+        )
+        self.assertIsNone(system.get_active_mode(None))
+
+    def test_get_active_modes(self) -> None:
+        """Test get active modes of all components."""
+        room = _room()
+        zone = _zone()
+        dhw = Dhw(hotwater=_hotwater(), circulation=_circulation())
+        ventilation = Ventilation(
+            time_program=_full_day_time_program(SettingModes.ON, 6),
+            operating_mode=OperatingModes.AUTO,
+            target_low=1,
+            target_high=6,
+        )
+        system = System(zones=[zone], rooms=[room], dhw=dhw, ventilation=ventilation)
+
+        active_modes = system.get_active_modes()
+
+        self.assertEqual(
+            [zone, room, dhw.hotwater, dhw.circulation, ventilation],
+            [comp for comp, _ in active_modes],
+        )
+        for comp, active_mode in active_modes:
+            self.assertEqual(system.get_active_mode(comp), active_mode)
+
+    def test_get_active_mode_zone_one_day_home_given_time(self) -> None:
+        """Test sunday is computed from the given time."""
+        sunday = TimeProgramDay(
+            [
+                TimePeriodSetting("00:00", None, SettingModes.NIGHT),
+                TimePeriodSetting("12:00", None, SettingModes.DAY),
+            ]
+        )
+        zone = _zone()
+        zone.heating.time_program.days["sunday"] = sunday
+        system = System(zones=[zone], quick_mode=QuickModes.ONE_DAY_AT_HOME)
+
+        morning = system.get_active_mode_zone(zone, datetime.datetime(2020, 3, 4, 8, 0))
+        afternoon = system.get_active_mode_zone(zone, datetime.datetime(2020, 3, 4, 14, 0))
+
+        self.assertEqual(zone.heating.target_low, morning.target)
+        self.assertEqual(zone.heating.target_high, afternoon.target)
@@ -1198,3 +1198,19 @@ async def test_retry_async(
         await func()
 
     assert cnt["cnt"] == (num_tries if should_retry else 1)
+
+
+@pytest.mark.asyncio
+async def test_retry_async_success() -> None:
+    cnt = {"cnt": 0}
+
+    @retry_async(num_tries=3, backoff_base=0)
+    async def func() -> str:
+        """Doc."""
+        cnt["cnt"] += 1
+        return "ok"
+
+    assert await func() == "ok"
+    assert cnt["cnt"] == 1
+    assert func.__name__ == "func"
+    assert func.__doc__ == "Doc."
@@ -1,6 +1,9 @@
+import copy
 import unittest
 from datetime import datetime
 
+import attr
+
 from pymultimatic.model import SettingModes, TimePeriodSetting, TimeProgram, TimeProgramDay
 
 
@@ -41,9 +44,51 @@ class TimeProgramTest(unittest.TestCase):
         current = timeprogram.get_for(datetime(2019, 2, 18, 0, 30))
         self._assert(tpds_sunday, current)
 
+    def test_time_program_many_settings(self) -> None:
+        settings = [
+            TimePeriodSetting(f"{hour:02d}:00", hour, SettingModes.ON) for hour in range(24)
+        ]
+        sunday = TimeProgramDay(settings)
+        saturday = TimeProgramDay([TimePeriodSetting("00:00", 5, SettingModes.OFF)])
+        timeprogram = TimeProgram({"saturday": saturday, "sunday": sunday})
+
+        for hour in range(1, 24):
+            current = timeprogram.get_for(datetime(2019, 2, 17, hour, 30))
+            self._assert(settings[hour], current)
+            next_setting = timeprogram.get_next(datetime(2019, 2, 17, hour - 1, 30))
+            self._assert(settings[hour], next_setting)
+
+    def test_hour_minute(self) -> None:
+        setting = TimePeriodSetting("7:05", None, SettingModes.ON, "24:00")
+        self.assertEqual(7, setting.hour)
+        self.assertEqual(5, setting.minute)
+        self.assertEqual(425, setting.absolute_minutes)
+
+    def test_setting_is_immutable(self) -> None:
+        setting = TimePeriodSetting("00:00", 25, SettingModes.ON)
+        day = TimeProgramDay([setting])
+        timeprogram = TimeProgram({"monday": day, "sunday": day})
+
+        self.assertIs(setting, timeprogram.get_for(datetime(2019, 2, 18, 1, 0)))
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            setting.target_temperature = 20  # type: ignore[misc]
+        self.assertEqual(setting, copy.deepcopy(setting))
+
+    def test_end_absolute_minutes(self) -> None:
+        setting = TimePeriodSetting("07:30", None, SettingModes.ON, "24:00")
+        self.assertEqual(1440, setting.end_absolute_minutes)
+        self.assertIsNone(TimePeriodSetting("07:30", None, SettingModes.ON).end_absolute_minutes)
+
     def test_wrong_start_time(self) -> None:
         self.assertRaises(ValueError, TimePeriodSetting, "xx", 25, "Test1")
 
+    def test_time_format(self) -> None:
+        for value in ("0:00", "07:30", "24:00"):
+            TimePeriodSetting(value, None, SettingModes.ON, value)
+        for value in ("", ":00", "123:00", "1:0", "12:345", "1a:00", "12:0b", "12-00", None):
+            self.assertRaises(ValueError, TimePeriodSetting, value, None, SettingModes.ON)
+        self.assertRaises(ValueError, TimePeriodSetting, "00:00", None, SettingModes.ON, "25")
+
     def _assert(self, expected: TimePeriodSetting, actual: TimePeriodSetting) -> None:
         self.assertEqual(expected.target_temperature, actual.target_temperature)
         self.assertEqual(expected.setting, actual.setting)
@@ -23,6 +23,15 @@ class ZoneTest(unittest.TestCase):
         self.assertEqual(zone.heating.target_high, active_mode.target)
         self.assertIsNone(active_mode.sub)
 
+    def test_get_active_mode_manual(self) -> None:
+        zone = _zone()
+        zone.heating.operating_mode = OperatingModes.MANUAL
+        active_mode = zone.active_mode
+
+        self.assertEqual(OperatingModes.MANUAL, active_mode.current)
+        self.assertEqual(zone.heating.target_high, active_mode.target)
+        self.assertIsNone(active_mode.sub)
+
     def test_get_active_mode_off(self) -> None:
         zone = _zone()
         zone.heating.operating_mode = OperatingModes.OFF